@@ -1,10 +1,20 @@
 import os
 import re
+import codecs
 import json
 import argparse
-from typing import List, Dict, Any
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional
 from datetime import datetime
 from pathlib import Path
+from dataclasses import dataclass
+
+try:
+    import orjson
+except ImportError:  # orjson не установлен, используется стандартный json
+    orjson = None
 
 # Единое место для определения расширений файлов
 FILE_EXTENSIONS = {
@@ -19,275 +29,395 @@ FILE_EXTENSIONS = {
     "rust": {".rs"},
     "csharp": {".cs"},
 }
+# Все поддерживаемые расширения и обратное отображение: расширение -> язык
+ALL_EXTENSIONS = frozenset().union(*FILE_EXTENSIONS.values())
+EXT_TO_LANG = {ext: lang for lang, exts in FILE_EXTENSIONS.items() for ext in exts}
+
+# Кодировки, которые однозначно определяются по BOM в начале файла
+BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# В UTF-16 ASCII-маркеры комментариев не совпадают с байтами файла
+UTF16_BOMS = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
 
 # Компилируем регулярные выражения для производительности
 POD_PATTERN = re.compile(r"^=(\w+)(.*?)^=cut", re.MULTILINE | re.DOTALL)
+TRIPLE_QUOTE_RE = re.compile(r'"""|\'\'\'')
+UNESCAPED_TRIPLE_QUOTE = {
+    '"""': re.compile(r'(?<!\\)"""'),
+    "'''": re.compile(r"(?<!\\)'''"),
+}
+NEWLINE_RE = re.compile("\n")
+
+# Разделители, на которых останавливается поиск комментариев в строке
+LINE_DELIMITER_RE = re.compile(r"//|/\*|[\"'`\\]")
+# Конец строкового литерала: закрывающая кавычка или экранирование
+STRING_END_RE = {
+    '"': re.compile(r'["\\]'),
+    "'": re.compile(r"['\\]"),
+    "`": re.compile(r"[`\\]"),
+}
+
+
+def _ext(path: str) -> str:
+    """Возвращает расширение файла как Path.suffix, но без создания Path"""
+    dot = path.rfind(".")
+    # Точка должна быть в имени файла, причем не первым и не последним символом
+    if dot <= path.rfind(os.sep) + 1 or dot == len(path) - 1:
+        return ""
+    return path[dot:]
+
+
+def _newline_offsets(content: str) -> List[int]:
+    """Возвращает отсортированные позиции переводов строк в тексте"""
+    return [match.start() for match in NEWLINE_RE.finditer(content)]
+
+
+@dataclass
+class Comment:
+    """Найденный комментарий и номер строки его начала"""
+
+    # Без __dict__ на каждый экземпляр: комментариев бывают миллионы
+    __slots__ = ("comment", "line")
+    comment: str
+    line: int
 
 
 class CommentParser:
     """Класс для парсинга комментариев с оптимизированной обработкой"""
 
-    def __init__(self):
-        self.all_extensions = {ext for exts in FILE_EXTENSIONS.values() for ext in exts}
-
     def find_source_files(self, directory: str) -> List[str]:
         """Рекурсивно находит все исходные файлы в директории"""
-        source_files = []
-        directory_path = Path(directory)
-
-        for file_path in directory_path.rglob("*"):
-            if file_path.is_file() and file_path.suffix in self.all_extensions:
-                source_files.append(str(file_path))
-
-        return source_files
+        return list(self._scan(directory))
+
+    def _scan(self, directory: str) -> Iterator[str]:
+        """Обходит директорию через os.scandir, не делая лишних stat() на файл"""
+        subdirs = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    # Ссылки на директории не обходим, как и rglob
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif _ext(entry.name) in ALL_EXTENSIONS and entry.is_file():
+                        yield entry.path
+        except PermissionError:
+            return
+
+        # Поддиректории обходим после файлов текущей директории
+        for subdir in subdirs:
+            yield from self._scan(subdir)
 
     def detect_language(self, filepath: str) -> str:
         """Определяет язык программирования по расширению файла"""
-        ext = Path(filepath).suffix
-        for lang, exts in FILE_EXTENSIONS.items():
-            if ext in exts:
-                return lang
-        return "unknown"
+        return EXT_TO_LANG.get(_ext(filepath), "unknown")
+
+    def read_file_bytes(self, filepath: str) -> bytes:
+        """Читает содержимое файла без декодирования"""
+        with open(filepath, "rb") as f:
+            return f.read()
 
-    def read_file_content(self, filepath: str) -> str:
+    def read_file_content(self, filepath: str, data: Optional[bytes] = None) -> str:
         """Читает содержимое файла с обработкой различных кодировок"""
         encodings = ["utf-8", "latin-1", "cp1251", "iso-8859-1"]
 
+        # Файл читается один раз, кодировки перебираются по байтам в памяти
+        if data is None:
+            data = self.read_file_bytes(filepath)
+
+        # При наличии BOM кодировка известна заранее
+        for bom, encoding in BOM_ENCODINGS:
+            if data.startswith(bom):
+                encodings.insert(0, encoding)
+                break
+
         for encoding in encodings:
             try:
-                with open(filepath, "r", encoding=encoding) as f:
-                    return f.read()
+                content = data.decode(encoding)
             except UnicodeDecodeError:
                 continue
+            # Переводы строк нормализуются так же, как в текстовом режиме
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+            return content
 
         print(f"Не удалось прочитать файл {filepath}")
         return ""
 
-    def parse_comments_in_file(self, filepath: str) -> List[Dict[str, Any]]:
-        """Извлекает комментарии из файла"""
-        content = self.read_file_content(filepath)
-        if not content:
-            return []
-
+    def parse_comments_in_file(
+        self, filepath: str, data: Optional[bytes] = None
+    ) -> List[Comment]:
+        """Извлекает комментарии из файла (или из уже прочитанных байтов)"""
         language = self.detect_language(filepath)
-        comments = self.parse_with_line_by_line(content, language)
+        if data is None:
+            data = self.read_file_bytes(filepath)
+
+        # Без маркеров комментариев в байтах разбирать нечего, даже декодировать
+        if not data.startswith(UTF16_BOMS) and not any(
+            marker in data for marker in COMMENT_MARKERS[language]
+        ):
+            return []
 
-        # Дополнительная обработка для специфичных языков
-        if language == "python":
-            comments.extend(self.parse_python_docstrings(content))
-        elif language == "perl":
-            comments.extend(self.parse_perl_pod(content))
+        content = self.read_file_content(filepath, data)
+        if not content:
+            return []
 
-        return comments
+        return SCANNERS[language](self, content)
 
-    def parse_with_line_by_line(
-        self, content: str, language: str
-    ) -> List[Dict[str, Any]]:
+    def parse_with_line_by_line(self, content: str, language: str) -> List[Comment]:
         """Оптимизированный построчный анализ для извлечения комментариев"""
+        # \r в тексте уже нет: read_file_content нормализует переводы строк
         lines = content.split("\n")
         comments = []
+        line_idx = 0
+        # Позиция начала текущей строки в content
+        offset = 0
 
-        # Состояния парсера
-        in_block_comment = False
-        block_comment_lines = []
-        block_start_line = 0
-
-        for line_num, line in enumerate(lines, 1):
-            line = line.rstrip("\r")
-
-            if in_block_comment:
-                # Ищем конец блочного комментария
-                end_idx = line.find("*/")
-                if end_idx != -1:
-                    # Конец блочного комментария
-                    block_comment_lines.append(line[:end_idx])
-                    comment_text = "\n".join(block_comment_lines).strip()
-                    if comment_text:
-                        comments.append(
-                            {"comment": comment_text, "line": block_start_line}
-                        )
-                    in_block_comment = False
-                    # Проверяем, есть ли код после комментария
-                    remaining = line[end_idx + 2 :].lstrip()
-                    if remaining and remaining.startswith("//"):
-                        # Однострочный комментарий после блочного
-                        comments.append(
-                            {"comment": remaining[2:].strip(), "line": line_num}
-                        )
-                else:
-                    # Продолжаем блочный комментарий
-                    block_comment_lines.append(line)
-                continue
+        while line_idx < len(lines):
+            line = lines[line_idx]
+            line_num = line_idx + 1
 
             # Поиск комментариев в строке
             comment_data = self.find_comments_in_line(line, language)
             if comment_data:
-                comment_type, comment_text, end_idx = comment_data
+                comment_type, comment_text, start_idx = comment_data
 
                 if comment_type == "line":
                     # Однострочный комментарий
-                    comments.append({"comment": comment_text.strip(), "line": line_num})
+                    comments.append(Comment(comment_text.strip(), line_num))
                 elif comment_type == "block":
-                    # Начало блочного комментария
-                    in_block_comment = True
-                    block_comment_lines = [comment_text]
-                    block_start_line = line_num
-
-                    # Проверяем, заканчивается ли блочный комментарий в этой же строке
-                    remaining = line[end_idx + 2 :]
-                    end_idx_inner = remaining.find("*/")
-                    if end_idx_inner != -1:
-                        # Блочный комментарий заканчивается в этой строке
-                        block_comment_lines[0] = remaining[:end_idx_inner]
-                        comment_text = "\n".join(block_comment_lines).strip()
-                        if comment_text:
+                    # Конец блочного комментария ищем сразу по всему тексту
+                    # и берем комментарий одним срезом
+                    block_start = offset + start_idx + 2
+                    block_end = content.find("*/", block_start)
+                    if block_end == -1:
+                        # Незакрытый комментарий тянется до конца файла
+                        break
+
+                    comment_text = content[block_start:block_end].strip()
+                    if comment_text:
+                        comments.append(Comment(comment_text, line_num))
+
+                    skipped_lines = content.count("\n", block_start, block_end)
+                    if skipped_lines:
+                        # Переходим на строку, где закончился комментарий
+                        line_idx += skipped_lines
+                        offset = content.rfind("\n", block_start, block_end) + 1
+                        line = lines[line_idx]
+                        # Проверяем, есть ли код после комментария
+                        remaining = line[block_end - offset + 2 :].lstrip()
+                        if remaining.startswith("//"):
+                            # Однострочный комментарий после блочного
                             comments.append(
-                                {"comment": comment_text, "line": block_start_line}
+                                Comment(remaining[2:].strip(), line_idx + 1)
                             )
-                        in_block_comment = False
+
+            offset += len(lines[line_idx]) + 1
+            line_idx += 1
 
         return comments
 
     def find_comments_in_line(self, line: str, language: str) -> tuple:
         """Находит комментарии в одной строке кода"""
         i = 0
-        in_string = False
-        string_char = None
-        escape_next = False
 
-        while i < len(line):
-            char = line[i]
-
-            if escape_next:
-                escape_next = False
-                i += 1
+        while True:
+            # Одним проходом регулярки ищем ближайший из всех разделителей
+            match = LINE_DELIMITER_RE.search(line, i)
+            if match is None:
+                return None
+
+            token = match.group()
+            found = match.start()
+
+            if token == "//":
+                # Однострочный комментарий
+                return ("line", line[found + 2 :], found)
+            if token == "/*":
+                # Блочный комментарий
+                return ("block", line[found + 2 :], found)
+            if token == "\\":
+                # Пропускаем экранированный символ
+                i = found + 2
                 continue
 
-            if char == "\\":
-                escape_next = True
-                i += 1
-                continue
+            # Строковый литерал: прыгаем к закрывающей кавычке,
+            # пропуская экранированные символы
+            string_end = STRING_END_RE[token]
+            i = found + 1
+            while True:
+                match = string_end.search(line, i)
+                if match is None:
+                    return None
+                if match.group() == "\\":
+                    i = match.end() + 1
+                    continue
+                i = match.end()
+                break
+
+    def parse_python_docstrings(self, content: str) -> List[Comment]:
+        """Извлекает docstrings из Python кода"""
+        docstrings = []
+        pos = 0
+        # Номер строки считается нарастающим итогом от предыдущего docstring
+        line_number = 1
+        counted_to = 0
+
+        # Прыгаем по тексту от одних тройных кавычек к другим, не обходя строки
+        while True:
+            opening = TRIPLE_QUOTE_RE.search(content, pos)
+            if opening is None:
+                break
+
+            line_number += content.count("\n", counted_to, opening.start())
+            counted_to = opening.start()
+
+            # Закрывают docstring незаэкранированные кавычки того же вида
+            closing = UNESCAPED_TRIPLE_QUOTE[opening.group()].search(
+                content, opening.end()
+            )
+            end = closing.start() if closing else len(content)
+            docstring_content = content[opening.end() : end]
+            if docstring_content:
+                docstrings.append(Comment(docstring_content.strip(), line_number))
+
+            if closing is None:
+                # Незакрытый docstring тянется до конца файла
+                break
+            # Остаток строки с закрывающими кавычками не рассматривается
+            pos = content.find("\n", closing.end()) + 1
+            if pos == 0:
+                break
 
-            if in_string:
-                if char == string_char:
-                    in_string = False
-                    string_char = None
-                i += 1
-                continue
+        return docstrings
 
-            if char in ['"', "'", "`"]:
-                in_string = True
-                string_char = char
-                i += 1
-                continue
+    def parse_perl_pod(self, content: str) -> List[Comment]:
+        """Извлекает POD документацию в Perl"""
+        pod_comments = []
+        newlines = None
 
-            # Проверяем начало комментариев
-            if i + 1 < len(line):
-                if line[i : i + 2] == "//":
-                    # Однострочный комментарий
-                    return ("line", line[i + 2 :], i)
-                elif line[i : i + 2] == "/*":
-                    # Блочный комментарий
-                    return ("block", line[i + 2 :], i)
+        for match in POD_PATTERN.finditer(content):
+            if newlines is None:
+                newlines = _newline_offsets(content)
+            pod_command = match.group(1).strip()
+            pod_content = match.group(2).strip()
+            # Номер строки = число переводов строк до начала блока + 1
+            line_number = bisect_left(newlines, match.start()) + 1
 
-            i += 1
+            pod_comments.append(Comment(f"={pod_command}: {pod_content}", line_number))
 
-        return None
+        return pod_comments
 
-    def parse_python_docstrings(self, content: str) -> List[Dict[str, Any]]:
-        """Извлекает docstrings из Python кода"""
-        docstrings = []
-        lines = content.split("\n")
-        i = 0
 
-        while i < len(lines):
-            line = lines[i]
-            quote_match = self.find_docstring_quotes(line)
+def _make_scanner(language: str):
+    """Собирает функцию разбора файла только из нужных языку проходов"""
+    if language == "python":
 
-            if quote_match:
-                start_idx, quote_type = quote_match
-                start_line = i + 1
-                docstring_content, end_line = self.extract_docstring_content(
-                    lines, i, start_idx, quote_type
-                )
+        def scan(parser, content):
+            comments = parser.parse_with_line_by_line(content, language)
+            comments.extend(parser.parse_python_docstrings(content))
+            return comments
 
-                if docstring_content:
-                    docstrings.append(
-                        {"comment": docstring_content.strip(), "line": start_line}
-                    )
-                    i = end_line
-            i += 1
+    elif language == "perl":
 
-        return docstrings
+        def scan(parser, content):
+            comments = parser.parse_with_line_by_line(content, language)
+            comments.extend(parser.parse_perl_pod(content))
+            return comments
 
-    def find_docstring_quotes(self, line: str) -> tuple:
-        """Находит начало docstring в строке"""
-        triple_double = line.find('"""')
-        triple_single = line.find("'''")
+    else:
 
-        if triple_double != -1 and (
-            triple_single == -1 or triple_double < triple_single
-        ):
-            return (triple_double, '"""')
-        elif triple_single != -1:
-            return (triple_single, "'''")
-        return None
-
-    def extract_docstring_content(
-        self, lines: List[str], start_idx: int, quote_pos: int, quote_type: str
-    ) -> tuple:
-        """Извлекает содержимое docstring"""
-        content_lines = []
-        current_line = lines[start_idx][quote_pos + 3 :]
-
-        # Проверяем, закрывается ли docstring в той же строке
-        end_pos = self.find_unescaped_quote(current_line, quote_type)
-        if end_pos != -1:
-            content_lines.append(current_line[:end_pos])
-            return "\n".join(content_lines), start_idx
-
-        content_lines.append(current_line)
-
-        # Ищем закрывающие кавычки в следующих строках
-        for i in range(start_idx + 1, len(lines)):
-            current_line = lines[i]
-            end_pos = self.find_unescaped_quote(current_line, quote_type)
-            if end_pos != -1:
-                content_lines.append(current_line[:end_pos])
-                return "\n".join(content_lines), i
-            content_lines.append(current_line)
-
-        return "\n".join(content_lines), len(lines) - 1
-
-    def find_unescaped_quote(self, line: str, quote_type: str) -> int:
-        """Ищет незаэкранированные кавычки в строке"""
-        pos = 0
-        while pos < len(line):
-            found_pos = line.find(quote_type, pos)
-            if found_pos == -1:
-                return -1
+        def scan(parser, content):
+            return parser.parse_with_line_by_line(content, language)
 
-            # Проверяем экранирование
-            if found_pos == 0 or line[found_pos - 1] != "\\":
-                return found_pos
+    return scan
 
-            pos = found_pos + 1
-        return -1
 
-    def parse_perl_pod(self, content: str) -> List[Dict[str, Any]]:
-        """Извлекает POD документацию в Perl"""
-        pod_comments = []
+# Функции разбора собираются один раз при импорте, выбор языка - один на файл
+SCANNERS = {
+    language: _make_scanner(language) for language in [*FILE_EXTENSIONS, "unknown"]
+}
 
-        for match in POD_PATTERN.finditer(content):
-            pod_command = match.group(1).strip()
-            pod_content = match.group(2).strip()
-            line_number = content[: match.start()].count("\n") + 1
 
-            pod_comments.append(
-                {"comment": f"={pod_command}: {pod_content}", "line": line_number}
-            )
+# Подстроки, хотя бы одна из которых есть в файле с комментариями
+C_STYLE_MARKERS = (b"//", b"/*")
+COMMENT_MARKERS = {language: C_STYLE_MARKERS for language in SCANNERS}
+COMMENT_MARKERS["python"] = C_STYLE_MARKERS + (b'"""', b"'''")
+COMMENT_MARKERS["perl"] = C_STYLE_MARKERS + (b"=cut",)
 
-        return pod_comments
+
+# Сколько файлов отдается рабочему процессу за одну задачу
+READ_BATCH_SIZE = 32
+# Сколько чтений одновременно выполняется в каждом рабочем процессе
+READ_THREADS = 4
+# Сколько пачек на один рабочий процесс может ждать в очереди разбора
+PARSE_QUEUE_FACTOR = 2
+
+# Парсер и потоки чтения рабочего процесса, создаются один раз в initializer пула
+_worker_parser = None
+_worker_reader = None
+
+
+def _init_worker():
+    """Инициализирует парсер и потоки чтения в рабочем процессе"""
+    global _worker_parser, _worker_reader
+    _worker_parser = CommentParser()
+    _worker_reader = ThreadPoolExecutor(max_workers=READ_THREADS)
+
+
+def _parse_batch(filepaths: List[str]) -> List[List[Comment]]:
+    """Разбирает пачку файлов в рабочем процессе"""
+    # read() отпускает GIL: следующие файлы читаются, пока разбирается текущий
+    contents = _worker_reader.map(_worker_parser.read_file_bytes, filepaths)
+    return [
+        _worker_parser.parse_comments_in_file(filepath, data)
+        for filepath, data in zip(filepaths, contents)
+    ]
+
+
+def _iter_parsed(executor, source_files: List[str], depth: int):
+    """Отдает пары (файл, комментарии) по порядку, держа в работе до depth пачек"""
+    batches = (
+        source_files[start : start + READ_BATCH_SIZE]
+        for start in range(0, len(source_files), READ_BATCH_SIZE)
+    )
+    pending = deque()
+    for batch in batches:
+        pending.append((batch, executor.submit(_parse_batch, batch)))
+        if len(pending) < depth:
+            continue
+        # Очередь заполнена: ждем самую старую пачку, остальные продолжают работу
+        done_batch, future = pending.popleft()
+        yield from zip(done_batch, future.result())
+
+    while pending:
+        done_batch, future = pending.popleft()
+        yield from zip(done_batch, future.result())
+
+
+def dump_json(data: Any) -> bytes:
+    """Сериализует данные в JSON с отступами (через orjson, если он есть)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(
+        data, ensure_ascii=False, indent=2, default=_comment_to_json
+    ).encode("utf-8")
+
+
+def _nested_json(data: Any, level: int) -> bytes:
+    """Сериализует данные для вставки на заданный уровень вложенности документа"""
+    # Переводы строк внутри JSON-строк экранированы, поэтому все \n здесь - отступы
+    return dump_json(data).replace(b"\n", b"\n" + b"  " * level)
+
+
+def _comment_to_json(obj: Any) -> Dict[str, Any]:
+    """Представляет Comment для стандартного json в прежнем виде"""
+    if isinstance(obj, Comment):
+        return {"comment": obj.comment, "line": obj.line}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def print_progress_bar(
@@ -334,42 +464,71 @@ def main():
     print(f"Найдено файлов: {total_files}")
     print("Обработка файлов...")
 
-    files_comments = {}
+    processed_files = 0
     total_comments = 0
 
-    for i, source_file in enumerate(source_files, 1):
-        comments = parser.parse_comments_in_file(source_file)
-        files_comments[source_file] = comments
-        total_comments += len(comments)
+    # Результат пишется по мере разбора во временный файл, чтобы при ошибке
+    # на месте выходного файла не остался обрезанный JSON
+    tmp_file = args.output_file + ".tmp"
+    tmp_created = False
 
-        print_progress_bar(i, total_files, total_comments)
+    try:
+        with open(tmp_file, "wb") as output:
+            tmp_created = True
+            output.write(
+                b'{\n  "directory": ' + dump_json(str(input_dir)) + b',\n  "files": {'
+            )
 
-    print()  # Новая строка после прогресс-бара
+            # Разбор файлов не имеет общего состояния, поэтому раздаем его по процессам
+            workers = os.cpu_count() or 1
 
-    # Формирование результата
-    result = {
-        "directory": str(input_dir),
-        "analyzeTime": datetime.now().isoformat(),
-        "statistics": {
-            "totalFiles": total_files,
-            "processedFiles": len(files_comments),
-            "totalComments": total_comments,
-        },
-        "files": files_comments,
-    }
-
-    # Сохранение результатов
-    try:
-        with open(args.output_file, "w", encoding="utf-8") as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
-        print(f"✓ Результат сохранен в {args.output_file}")
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker
+            ) as executor:
+                parsed = _iter_parsed(
+                    executor, source_files, PARSE_QUEUE_FACTOR * workers
+                )
+                for source_file, comments in parsed:
+                    output.write(b",\n    " if processed_files else b"\n    ")
+                    output.write(
+                        dump_json(source_file) + b": " + _nested_json(comments, 2)
+                    )
+                    processed_files += 1
+                    total_comments += len(comments)
+
+                    print_progress_bar(processed_files, total_files, total_comments)
+
+            # Статистика известна только в конце, поэтому пишется после файлов
+            statistics = {
+                "totalFiles": total_files,
+                "processedFiles": processed_files,
+                "totalComments": total_comments,
+            }
+            output.write(
+                b'\n  },\n  "analyzeTime": '
+                + dump_json(datetime.now().isoformat())
+                + b',\n  "statistics": '
+                + _nested_json(statistics, 1)
+                + b"\n}"
+            )
+
+        os.replace(tmp_file, args.output_file)
     except Exception as e:
+        print()  # Новая строка после прогресс-бара
         print(f"✗ Ошибка при сохранении: {e}")
+        if tmp_created:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
         return
 
+    print()  # Новая строка после прогресс-бара
+    print(f"✓ Результат сохранен в {args.output_file}")
+
     # Статистика
     print(f"\nОбработка завершена!")
-    print(f"• Обработано файлов: {len(files_comments)}/{total_files}")
+    print(f"• Обработано файлов: {processed_files}/{total_files}")
     print(f"• Найдено комментариев: {total_comments}")
 
 